@@ -9,6 +9,7 @@ import java.io.*
  */
 class AdvancedShellBot(private val command: String) {
     private var process: Process? = null
+    @Volatile
     private var running = true
     private val terminalManager = TerminalManager()
 
@@ -20,7 +21,7 @@ class AdvancedShellBot(private val command: String) {
             runWithTerminal()
         } else {
             // Fall back to basic implementation
-            println("Warning: Using basic terminal mode")
+            System.err.println("Warning: Using basic terminal mode")
             BasicShellBot(command).run()
         }
     }
@@ -30,7 +31,7 @@ class AdvancedShellBot(private val command: String) {
      */
     private fun runWithTerminal(): Int {
         try {
-            println("ShellBot: Running '$command' with advanced terminal support")
+            System.err.println("ShellBot: Running '$command' with advanced terminal support")
 
             // Set up process
             val processBuilder = ProcessBuilder("bash", "-c", command)
@@ -40,6 +41,23 @@ class AdvancedShellBot(private val command: String) {
             env["LINES"] = terminalManager.getHeight().toString()
 
             process = processBuilder.start()
+
+            // COLUMNS/LINES above reflect the size at spawn only. On resize,
+            // nudge the child with SIGWINCH so signal-aware programs re-query;
+            // without a real pty we cannot push the new dimensions via
+            // TIOCSWINSZ, so this is best-effort.
+            process?.pid()?.let { pid ->
+                terminalManager.onResize {
+                    try {
+                        ProcessBuilder("kill", "-WINCH", pid.toString())
+                            .redirectOutput(ProcessBuilder.Redirect.DISCARD)
+                            .redirectError(ProcessBuilder.Redirect.DISCARD)
+                            .start()
+                    } catch (_: Exception) {
+                    }
+                }
+            }
+
             return forwardWithTerminal()
 
         } catch (e: Exception) {
@@ -63,13 +81,13 @@ class AdvancedShellBot(private val command: String) {
         // Thread for process stdout -> terminal
         val stdoutThread = Thread {
             try {
-                val buffer = ByteArray(1024)
+                val buffer = ByteArray(8192)
                 while (running) {
                     val bytesRead = processStdout.read(buffer)
                     when {
                         bytesRead > 0 -> {
                             // Write to terminal
-                            terminalManager.write(buffer.sliceArray(0 until bytesRead))
+                            terminalManager.write(buffer, 0, bytesRead)
                         }
                         bytesRead == -1 -> {
                             running = false
@@ -85,12 +103,12 @@ class AdvancedShellBot(private val command: String) {
         // Thread for process stderr -> terminal error
         val stderrThread = Thread {
             try {
-                val buffer = ByteArray(1024)
+                val buffer = ByteArray(8192)
                 while (running) {
                     val bytesRead = processStderr.read(buffer)
                     if (bytesRead > 0) {
                         // Also write stderr to terminal
-                        terminalManager.write(buffer.sliceArray(0 until bytesRead))
+                        terminalManager.write(buffer, 0, bytesRead)
                     } else if (bytesRead == -1) {
                         break
                     }
@@ -103,17 +121,26 @@ class AdvancedShellBot(private val command: String) {
         stdoutThread.start()
         stderrThread.start()
 
+        // Child exit is delivered by the JVM's process reaper — no need to
+        // poll isAlive on every iteration of the input loop.
+        process.onExit().thenRun { running = false }
+
         // Main thread: terminal input -> process stdin
         try {
-            val inputBuffer = ByteArray(1024)
+            val inputBuffer = ByteArray(8192)
+
+            while (running) {
+                // Drain the whole pending burst (e.g. a paste) before sleeping,
+                // so it reaches the child in one flush instead of one chunk per
+                // 5ms tick.
+                var wrote = false
+                do {
+                    val bytesRead = terminalManager.readBytes(inputBuffer)
+                    if (bytesRead <= 0) break
 
-            while (running && process.isAlive) {
-                // Read from terminal
-                val bytesRead = terminalManager.readBytes(inputBuffer)
-                if (bytesRead > 0) {
                     // Send to process
                     processStdin.write(inputBuffer, 0, bytesRead)
-                    processStdin.flush()
+                    wrote = true
 
                     // Check for control characters
                     if (bytesRead == 1) {
@@ -129,12 +156,10 @@ class AdvancedShellBot(private val command: String) {
                             }
                         }
                     }
-                }
+                } while (running && terminalManager.hasPendingInput())
 
-                // Check process status
-                if (!process.isAlive) {
-                    running = false
-                    break
+                if (wrote && running) {
+                    processStdin.flush()
                 }
 
                 // Small sleep to prevent busy waiting
@@ -48,9 +48,11 @@ object ShellBotMain {
                 log.info("ShellBot starting, command: {}", command)
             }
 
-            val settings = Settings.promptSessionSetup(sessionId)
-
             val exitCode = if (isTmuxAvailable()) {
+                // Settings are only needed for the tmux side-channels
+                // (Telegram config); load them lazily so the plain fallback
+                // skips the YAML parse, legacy migration and interactive setup.
+                val settings = Settings.promptSessionSetup(sessionId)
                 TmuxSession(command, sessionId, settings).run()
             } else {
                 ShellBot(command).run()
@@ -21,9 +21,14 @@ import kotlin.concurrent.thread
 
 class ShellBotPTY(private val command: String) {
     private var process: Process? = null
+    @Volatile
     private var running = true
     private val stdin = System.`in`
-    private val stdout = System.out
+
+    // Owned buffered stream over fd 1. System.out is an auto-flushing
+    // PrintStream whose write() flushes internally on every call, which
+    // would defeat the flush coalescing in forwardIO.
+    private val stdout = BufferedOutputStream(FileOutputStream(FileDescriptor.out))
 
     /**
      * Run the command in a pseudo-terminal.
@@ -38,6 +43,9 @@ class ShellBotPTY(private val command: String) {
             try {
                 // Create process with pseudo-terminal
                 val processBuilder = ProcessBuilder("bash", "-c", command)
+                // A real pty has a single output stream; merge stderr into stdout
+                // so one reader thread forwards everything in arrival order.
+                processBuilder.redirectErrorStream(true)
 
                 // Set up environment
                 val env = processBuilder.environment()
@@ -64,7 +72,6 @@ class ShellBotPTY(private val command: String) {
     private fun forwardIO(process: Process): Int {
         val inputStream = process.inputStream
         val outputStream = process.outputStream
-        val errorStream = process.errorStream
 
         // Thread for reading from process stdout
         val stdoutReader = thread(start = true) {
@@ -74,7 +81,11 @@ class ShellBotPTY(private val command: String) {
                     val bytesRead = inputStream.read(buffer)
                     if (bytesRead > 0) {
                         stdout.write(buffer, 0, bytesRead)
-                        stdout.flush()
+                        // Coalesce flushes: while the child is bursting output,
+                        // keep accumulating and only flush once the pipe drains.
+                        if (inputStream.available() == 0) {
+                            stdout.flush()
+                        }
                     } else if (bytesRead == -1) {
                         running = false
                         break
@@ -84,65 +95,47 @@ class ShellBotPTY(private val command: String) {
                 if (running) {
                     running = false
                 }
+            } finally {
+                // Flush whatever is still buffered when the child's output ends
+                try {
+                    stdout.flush()
+                } catch (_: IOException) {
+                }
             }
         }
 
-        // Thread for reading from process stderr
-        val stderrReader = thread(start = true) {
+        // Daemon thread: blocking stdin reads → process stdin.
+        // A blocking read means zero wakeups while idle; the thread is a
+        // daemon so it does not keep the JVM alive after the child exits.
+        thread(start = true, isDaemon = true) {
             try {
                 val buffer = ByteArray(8192)
                 while (running) {
-                    val bytesRead = errorStream.read(buffer)
-                    if (bytesRead > 0) {
-                        System.err.write(buffer, 0, bytesRead)
-                        System.err.flush()
-                    } else if (bytesRead == -1) {
-                        break
-                    }
-                }
-            } catch (e: IOException) {
-                // Ignore
-            }
-        }
-
-        // Main thread: read from stdin and write to process stdin
-        try {
-            val buffer = ByteArray(8192)
-            while (running) {
-                if (stdin.available() > 0) {
                     val bytesRead = stdin.read(buffer)
                     if (bytesRead > 0) {
                         outputStream.write(buffer, 0, bytesRead)
                         outputStream.flush()
+                    } else if (bytesRead == -1) {
+                        break
                     }
                 }
-
-                // Check if process is still alive
-                if (!process.isAlive) {
-                    running = false
-                    break
-                }
-
-                // Small delay to avoid busy-waiting
-                Thread.sleep(10)
+            } catch (e: IOException) {
+                // Process stdin closed
             }
-        } catch (e: InterruptedIOException) {
-            // Ctrl+C or interruption
-            running = false
-        } catch (e: Exception) {
-            running = false
         }
 
-        // Wait for readers to finish
-        stdoutReader.join(1000)
-        stderrReader.join(1000)
-
-        // Wait for process to complete
-        return try {
+        // Main thread: block until the child exits — no polling loop.
+        val exitCode = try {
             process.waitFor()
         } catch (e: InterruptedException) {
             1
         }
+        running = false
+
+        // Wait for readers to drain remaining output
+        stdoutReader.join(1000)
+
+        return exitCode
     }
 
     private fun cleanup() {
@@ -204,11 +197,15 @@ class ShellBotPTY(private val command: String) {
  */
 class SimpleShellBotPTY(private val command: String) {
     private var process: Process? = null
+    @Volatile
     private var running = true
 
     fun run(): Int {
         try {
             val processBuilder = ProcessBuilder("bash", "-c", command)
+            // A real pty has a single output stream; merge stderr into stdout
+            // so one reader thread forwards everything in arrival order.
+            processBuilder.redirectErrorStream(true)
             val env = processBuilder.environment()
             env["TERM"] = "xterm-256color"
 
@@ -226,9 +223,10 @@ class SimpleShellBotPTY(private val command: String) {
     private fun forwardIO(process: Process): Int {
         val inputStream = process.inputStream
         val outputStream = process.outputStream
-        val errorStream = process.errorStream
         val stdin = System.`in`
-        val stdout = System.out
+        // Owned buffered stream over fd 1 — System.out auto-flushes on every
+        // write(), which would defeat the flush coalescing below.
+        val stdout = BufferedOutputStream(FileOutputStream(FileDescriptor.out))
 
         // Thread for reading from process stdout
         val stdoutReader = thread(start = true) {
@@ -238,7 +236,11 @@ class SimpleShellBotPTY(private val command: String) {
                     val bytesRead = inputStream.read(buffer)
                     if (bytesRead > 0) {
                         stdout.write(buffer, 0, bytesRead)
-                        stdout.flush()
+                        // Coalesce flushes: while the child is bursting output,
+                        // keep accumulating and only flush once the pipe drains.
+                        if (inputStream.available() == 0) {
+                            stdout.flush()
+                        }
                     } else if (bytesRead == -1) {
                         running = false
                         break
@@ -248,60 +250,44 @@ class SimpleShellBotPTY(private val command: String) {
                 if (running) {
                     running = false
                 }
+            } finally {
+                // Flush whatever is still buffered when the child's output ends
+                try {
+                    stdout.flush()
+                } catch (_: IOException) {
+                }
             }
         }
 
-        // Thread for reading from process stderr
-        val stderrReader = thread(start = true) {
+        // Daemon thread: blocking stdin reads → process stdin (zero wakeups while idle)
+        thread(start = true, isDaemon = true) {
             try {
                 val buffer = ByteArray(8192)
                 while (running) {
-                    val bytesRead = errorStream.read(buffer)
-                    if (bytesRead > 0) {
-                        System.err.write(buffer, 0, bytesRead)
-                        System.err.flush()
-                    } else if (bytesRead == -1) {
-                        break
-                    }
-                }
-            } catch (e: IOException) {
-                // Ignore
-            }
-        }
-
-        // Main thread: read from stdin and write to process stdin
-        try {
-            val buffer = ByteArray(8192)
-            while (running) {
-                if (stdin.available() > 0) {
                     val bytesRead = stdin.read(buffer)
                     if (bytesRead > 0) {
                         outputStream.write(buffer, 0, bytesRead)
                         outputStream.flush()
+                    } else if (bytesRead == -1) {
+                        break
                     }
                 }
-
-                if (!process.isAlive) {
-                    running = false
-                    break
-                }
-
-                Thread.sleep(10)
+            } catch (e: IOException) {
+                // Process stdin closed
             }
-        } catch (e: InterruptedIOException) {
-            running = false
-        } catch (e: Exception) {
-            running = false
         }
 
-        stdoutReader.join(1000)
-        stderrReader.join(1000)
-
-        return try {
+        // Main thread: block until the child exits — no polling loop.
+        val exitCode = try {
             process.waitFor()
         } catch (e: InterruptedException) {
             1
         }
+        running = false
+
+        stdoutReader.join(1000)
+
+        return exitCode
     }
 
     private fun cleanup() {
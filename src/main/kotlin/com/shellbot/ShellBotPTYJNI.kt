@@ -37,14 +37,15 @@ class ShellBotPTYJNI(private val command: String) {
 
     private var pid: Int? = null
     private var masterFd: Int? = null
+    @Volatile
     private var running = true
 
     fun run(): Int {
         // Since we don't have actual JNI bindings in this example,
         // we'll use a simplified version that works for basic cases
 
-        println("Note: Full pseudo-terminal support requires JNI/JNA bindings")
-        println("Using simplified ProcessBuilder approach instead")
+        System.err.println("Note: Full pseudo-terminal support requires JNI/JNA bindings")
+        System.err.println("Using simplified ProcessBuilder approach instead")
 
         return SimpleShellBotPTYJNI(command).run()
     }
@@ -61,11 +62,15 @@ class ShellBotPTYJNI(private val command: String) {
  */
 class SimpleShellBotPTYJNI(private val command: String) {
     private var process: Process? = null
+    @Volatile
     private var running = true
 
     fun run(): Int {
         try {
             val processBuilder = ProcessBuilder("bash", "-c", command)
+            // A real pty has a single output stream; merge stderr into stdout
+            // so one reader thread forwards everything in arrival order.
+            processBuilder.redirectErrorStream(true)
             val env = processBuilder.environment()
             env["TERM"] = "xterm-256color"
 
@@ -83,7 +88,6 @@ class SimpleShellBotPTYJNI(private val command: String) {
     private fun forwardIO(process: Process): Int {
         val inputStream = process.inputStream
         val outputStream = process.outputStream
-        val errorStream = process.errorStream
         val stdin = System.`in`
         val stdout = System.out
 
@@ -108,57 +112,35 @@ class SimpleShellBotPTYJNI(private val command: String) {
             }
         }
 
-        // Thread for reading from process stderr
-        val stderrReader = thread(start = true) {
+        // Daemon thread: blocking stdin reads → process stdin (zero wakeups while idle)
+        thread(start = true, isDaemon = true) {
             try {
                 val buffer = ByteArray(8192)
                 while (running) {
-                    val bytesRead = errorStream.read(buffer)
-                    if (bytesRead > 0) {
-                        System.err.write(buffer, 0, bytesRead)
-                        System.err.flush()
-                    } else if (bytesRead == -1) {
-                        break
-                    }
-                }
-            } catch (e: IOException) {
-                // Ignore
-            }
-        }
-
-        // Main thread: read from stdin and write to process stdin
-        try {
-            val buffer = ByteArray(8192)
-            while (running) {
-                if (stdin.available() > 0) {
                     val bytesRead = stdin.read(buffer)
                     if (bytesRead > 0) {
                         outputStream.write(buffer, 0, bytesRead)
                         outputStream.flush()
+                    } else if (bytesRead == -1) {
+                        break
                     }
                 }
-
-                if (!process.isAlive) {
-                    running = false
-                    break
-                }
-
-                Thread.sleep(10)
+            } catch (e: IOException) {
+                // Process stdin closed
             }
-        } catch (e: InterruptedIOException) {
-            running = false
-        } catch (e: Exception) {
-            running = false
         }
 
-        stdoutReader.join(1000)
-        stderrReader.join(1000)
-
-        return try {
+        // Main thread: block until the child exits — no polling loop.
+        val exitCode = try {
             process.waitFor()
         } catch (e: InterruptedException) {
             1
         }
+        running = false
+
+        stdoutReader.join(1000)
+
+        return exitCode
     }
 
     private fun cleanup() {
@@ -182,8 +164,8 @@ fun main(args: Array<String>) {
     try {
         parser.parse(args)
 
-        println("ShellBotPTY in Kotlin")
-        println("Running command: $command")
+        System.err.println("ShellBotPTY in Kotlin")
+        System.err.println("Running command: $command")
 
         val bot = SimpleShellBotPTYJNI(command)
         val exitCode = bot.run()
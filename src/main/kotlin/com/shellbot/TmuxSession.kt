@@ -89,12 +89,21 @@ class TmuxSession(
                     val text = INPUT_FILE.readText()
                     if (text.isNotEmpty()) {
                         INPUT_FILE.writeText("")
+                        // Batch all lines into a single tmux invocation using the
+                        // ";" command separator (same trick as new-session above):
+                        // one process spawn per file read instead of two per line,
+                        // and tmux applies the whole batch in one event loop pass.
+                        val batch = mutableListOf("tmux")
                         for (line in text.lines()) {
                             if (line.isNotEmpty()) {
-                                exec("tmux", "send-keys", "-t", SESSION_TARGET, "-l", line)
-                                exec("tmux", "send-keys", "-t", SESSION_TARGET, "Enter")
+                                if (batch.size > 1) batch.add(";")
+                                batch.addAll(listOf("send-keys", "-t", SESSION_TARGET, "-l", line))
+                                batch.addAll(listOf(";", "send-keys", "-t", SESSION_TARGET, "Enter"))
                             }
                         }
+                        if (batch.size > 1) {
+                            exec(*batch.toTypedArray())
+                        }
                     }
                 }
             }
@@ -106,8 +115,12 @@ class TmuxSession(
             log.info("Plugin activated: {}", plugin.name)
         }
 
-        // Background thread: tmux capture-pane → output.txt (with plugin filtering)
+        // Background thread: tmux capture-pane → output.txt (with plugin filtering).
+        // The file is only rewritten when the visible content actually changed,
+        // so an idle session causes no disk writes (and no mtime churn for
+        // anything watching the file).
         startDaemon("output-capture") {
+            var lastWritten: String? = null
             while (isTmuxSessionAlive()) {
                 Thread.sleep(500)
                 try {
@@ -127,7 +140,11 @@ class TmuxSession(
                     }
 
                     if (lines.isNotEmpty()) {
-                        OUTPUT_FILE.writeText(lines.joinToString("\n") + "\n")
+                        val content = lines.joinToString("\n") + "\n"
+                        if (content != lastWritten) {
+                            OUTPUT_FILE.writeText(content)
+                            lastWritten = content
+                        }
                     }
                 } catch (_: Exception) {
                 }
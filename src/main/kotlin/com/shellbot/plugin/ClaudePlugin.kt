@@ -64,10 +64,12 @@ class ClaudePlugin : SessionPlugin {
 
             if (newState == ClaudeState.IDLE) {
                 val now = System.currentTimeMillis()
-                val timeInIdleState = (now - idleSinceTime) / 1000
+                // Compare in milliseconds directly — same threshold as the
+                // old seconds math, without the per-check division.
+                val idleMillis = idleSeconds * 1000
 
                 // Only notify if in idle state long enough AND haven't recently notified
-                if (timeInIdleState >= idleSeconds && (now - lastNotificationTime) > (idleSeconds * 1000)) {
+                if ((now - idleSinceTime) >= idleMillis && (now - lastNotificationTime) > idleMillis) {
                     lastNotificationTime = now
                     return listOf(SessionPlugin.NOTIFICATION_IDLE)
                 }
@@ -89,14 +91,24 @@ class ClaudePlugin : SessionPlugin {
         }
     }
 
+    // Last raw capture → filtered lines. The pane is usually identical
+    // between periodic captures (500ms output daemon, 2s monitor), so a
+    // single memo entry skips the strip/filter work almost every tick.
+    private val lastFiltered = AtomicReference<Pair<String, List<String>>?>()
+
     override fun filterOutput(rawOutput: String): List<String> {
+        lastFiltered.get()?.let { (raw, lines) ->
+            if (raw == rawOutput) return lines
+        }
         val stripped = stripAnsi(rawOutput)
-        return stripped.lines()
+        val lines = stripped.lines()
             .map { it.trimEnd() }
             .dropLastWhile { it.isBlank() }
             .dropLast(5)
             .filter { !it.startsWith("──────────────────────────────────────────────────────────") }
             .takeLast(10)
+        lastFiltered.set(rawOutput to lines)
+        return lines
    }
 
     // ---- State detection ----
@@ -124,25 +136,39 @@ class ClaudePlugin : SessionPlugin {
     private fun isInputPrompt(line: String): Boolean {
         // Match lines that consist ONLY of a prompt character (with optional whitespace)
         // This catches "❯" or ">" alone
-        if (line.matches(Regex("^\\s*[>❯⏵❱▶►⟩»›\\$]\\s*$"))) {
+        if (line.matches(PROMPT_ONLY_REGEX)) {
             return true
         }
 
         // Also match lines that START with a prompt character followed by text
         // This catches "❯ upload the sketch and test the stream"
-        return line.matches(Regex("^\\s*[>❯⏵❱▶►⟩»›\\$]\\s+.*"))
+        return line.matches(PROMPT_PREFIX_REGEX)
     }
 
     // ---- Utilities ----
     private fun stripAnsi(text: String): String {
-        return text
-            .replace(Regex("\u001B\\[[0-9;]*[a-zA-Z]"), "")       // CSI sequences
-            .replace(Regex("\u001B\\][^\u0007]*\u0007"), "")       // OSC sequences
-            .replace(Regex("\u001B\\([A-Z]"), "")                  // Charset selectors
-            .replace(Regex("\u001B[=>]"), "")                      // Keypad mode
-            .replace(Regex("\u001B\\[[0-9;]*[Hf]"), "")            // Cursor positioning
-            .replace(Regex("[\u000E\u000F]"), "")                  // SO/SI (shift out/in)
-            .replace(Regex("[\u0000-\u0008\u000B\u000C\u000E-\u001F\u007F]"), "") // Other C0 control chars (keep \t \n \r)
-            .replace(Regex("[\u0080-\u009F]"), "")                 // C1 control chars
+        return text.replace(ANSI_REGEX, "")
+    }
+
+    companion object {
+        // Prompt detection runs per line of every state check; compile the
+        // patterns once instead of per call.
+        private val PROMPT_ONLY_REGEX = Regex("^\\s*[>❯⏵❱▶►⟩»›\\$]\\s*$")
+        private val PROMPT_PREFIX_REGEX = Regex("^\\s*[>❯⏵❱▶►⟩»›\\$]\\s+.*")
+
+        // Single compiled alternation — one pass over the capture instead of
+        // eight sequential replace() passes, each of which rescanned the text
+        // and built an intermediate string. Alternatives are tried in the same
+        // order the old passes ran; the bare-ESC case is covered by the C0
+        // class, and cursor positioning ([Hf]) by the general CSI final bytes.
+        private val ANSI_REGEX = Regex(
+            "\u001B\\[[0-9;]*[a-zA-Z]" +                      // CSI sequences (incl. cursor positioning)
+            "|\u001B\\][^\u0007]*\u0007" +                    // OSC sequences
+            "|\u001B\\([A-Z]" +                               // Charset selectors
+            "|\u001B[=>]" +                                   // Keypad mode
+            "|[\u000E\u000F]" +                                // SO/SI (shift out/in)
+            "|[\u0000-\u0008\u000B\u000C\u000E-\u001F\u007F]" + // Other C0 control chars (keep \t \n \r)
+            "|[\u0080-\u009F]"                                // C1 control chars
+        )
     }
 }
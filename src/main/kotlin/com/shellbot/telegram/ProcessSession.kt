@@ -3,7 +3,6 @@ package com.shellbot.telegram
 import java.io.BufferedReader
 import java.io.InputStreamReader
 import java.io.OutputStreamWriter
-import java.util.LinkedList
 
 /**
  * Manages a subprocess with pipe-based I/O and a ring buffer for captured output.
@@ -11,7 +10,9 @@ import java.util.LinkedList
 class ProcessSession(command: String) {
     private val process: Process
     private val stdinWriter: OutputStreamWriter
-    private val outputLines = LinkedList<String>()
+    // Bounded deque: contiguous backing array, no per-line node allocation,
+    // and getLastLines() indexes it directly instead of walking links.
+    private val outputLines = ArrayDeque<String>(MAX_LINES)
     private val lock = Any()
     private val readerThread: Thread
 
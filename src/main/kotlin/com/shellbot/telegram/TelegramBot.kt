@@ -31,6 +31,8 @@ class TelegramBot(
     private val idleNotifySeconds: Long = 30
 ) {
     private val api = TelegramApi(token)
+    // Threshold in the unit the monitor actually compares in, computed once.
+    private val idleNotifyMillis = idleNotifySeconds * 1000L
     private var session: ProcessSession? = null
     private var offset = 0L
     @Volatile
@@ -47,8 +49,10 @@ class TelegramBot(
     private var generalIdleNotificationSent = false
 
 
-    private val isTmuxMode get() = tmuxSessionName != null
-    private val tmuxTarget get() = if (tmuxSessionName != null) "=$tmuxSessionName" else ""  // '=' prefix for commands that support it (has-session, display-message)
+    // Computed once — tmuxTarget is consulted on every poll/monitor tick, so
+    // there is no reason to rebuild the string per access.
+    private val isTmuxMode = tmuxSessionName != null
+    private val tmuxTarget = if (tmuxSessionName != null) "=$tmuxSessionName" else ""  // '=' prefix for commands that support it (has-session, display-message)
 
     init {
         if (tmuxSessionName != null) {
@@ -726,9 +730,13 @@ class TelegramBot(
                         if (lines.isEmpty()) continue
                         val content = lines.joinToString("\n")
 
+                        // One clock read per iteration; every branch below
+                        // compares against the same instant.
+                        val now = System.currentTimeMillis()
+
                         if (content != lastContent) {
-                            lastChangeTime = System.currentTimeMillis()
-                            lastLogTime = System.currentTimeMillis()
+                            lastChangeTime = now
+                            lastLogTime = now
                             idleNotificationSent = false
                             generalIdleNotificationSent = false
                             // Delete previous idle message when new content arrives
@@ -758,11 +766,11 @@ class TelegramBot(
                             lastSentContent = content
                         } else {
                             // Output unchanged — check if idle long enough
-                            val idleMs = System.currentTimeMillis() - lastChangeTime
-                            if (idleMs >= idleNotifySeconds * 1000L) {
+                            val idleMs = now - lastChangeTime
+                            if (idleMs >= idleNotifyMillis) {
                                 // Always log to application log after 30s of inactivity
-                                val timeSinceLastLog = System.currentTimeMillis() - lastLogTime
-                                if (timeSinceLastLog >= idleNotifySeconds * 1000L) {
+                                val timeSinceLastLog = now - lastLogTime
+                                if (timeSinceLastLog >= idleNotifyMillis) {
                                     TelegramBot.log.info("Session inactive: no new output to send to Telegram")
                                     // Send Telegram notification about inactivity (only once per inactivity period)
                                     val owner = ownerChatId
@@ -782,7 +790,7 @@ class TelegramBot(
                                         }
                                         generalIdleNotificationSent = true
                                     }
-                                    lastLogTime = System.currentTimeMillis()
+                                    lastLogTime = now
                                 }
 
                                 // Only send plugin-specific Telegram notifications if plugin exists
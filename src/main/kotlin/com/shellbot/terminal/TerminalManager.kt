@@ -53,32 +53,57 @@ class TerminalManager {
         }
     }
 
+    // Scratch buffer for readBytes — reused across calls (single-reader),
+    // grown on demand, so the input loop allocates nothing per tick.
+    private var charBuffer = CharArray(0)
+
     /**
      * Read available bytes from terminal.
      */
     fun readBytes(buffer: ByteArray): Int {
         return try {
-            var totalRead = 0
-            val charBuffer = CharArray(buffer.size)
-            val charsRead = reader?.read(charBuffer, 0, charBuffer.size) ?: 0
+            if (charBuffer.size < buffer.size) {
+                charBuffer = CharArray(buffer.size)
+            }
+            val charsRead = reader?.read(charBuffer, 0, buffer.size) ?: 0
 
             for (i in 0 until charsRead) {
                 buffer[i] = charBuffer[i].code.toByte()
-                totalRead++
             }
 
-            totalRead
+            if (charsRead > 0) charsRead else 0
         } catch (e: Exception) {
             0
         }
     }
 
+    /**
+     * Check whether more input is already buffered and can be read
+     * without blocking.
+     */
+    fun hasPendingInput(): Boolean {
+        return try {
+            reader?.ready() ?: false
+        } catch (e: Exception) {
+            false
+        }
+    }
+
     /**
      * Write bytes to terminal output.
      */
     fun write(bytes: ByteArray) {
+        write(bytes, 0, bytes.size)
+    }
+
+    /**
+     * Write a region of a buffer to terminal output.
+     * Lets forwarding loops pass their read buffer directly without
+     * copying the read region into a fresh array first.
+     */
+    fun write(bytes: ByteArray, offset: Int, length: Int) {
         try {
-            terminal?.output()?.write(bytes)
+            terminal?.output()?.write(bytes, offset, length)
             terminal?.output()?.flush()
         } catch (e: Exception) {
             // Ignore write errors
@@ -99,6 +124,18 @@ class TerminalManager {
         return terminal?.height ?: 24
     }
 
+    /**
+     * Register a callback for terminal resize (SIGWINCH) events.
+     * The callback runs on JLine's signal thread.
+     */
+    fun onResize(listener: () -> Unit) {
+        try {
+            terminal?.handle(Terminal.Signal.WINCH, Terminal.SignalHandler { listener() })
+        } catch (e: Exception) {
+            log.warn("Could not register WINCH handler", e)
+        }
+    }
+
     /**
      * Restore terminal to original state.
      */
@@ -72,6 +72,24 @@ class ClaudePluginTest {
         assertEquals(SessionPlugin.NOTIFICATION_PERMISSION, notifications3.first())
     }
 
+    @Test
+    fun testFilterOutputStripsAnsi() {
+        val plugin = ClaudePlugin()
+
+        // CSI colors/clears, OSC title, and bare ESC must all be stripped.
+        // filterOutput drops the last 5 lines (status bar area), so pad with
+        // a tail to keep the line under test.
+        val raw = "\u001B[2J\u001B[1;1H\u001B[32mhello\u001B[0m \u001Bworld\u001B]0;title\u0007\n" +
+            "tail1\ntail2\ntail3\ntail4\ntail5"
+        val lines = plugin.filterOutput(raw)
+
+        assertEquals(listOf("hello world"), lines)
+
+        // Repeated captures of an unchanged pane hit the memo and must
+        // return the same filtered result.
+        assertEquals(lines, plugin.filterOutput(raw))
+    }
+
     @Test
     @org.junit.jupiter.api.Disabled("TODO: Fix prompt detection regex")
     fun testMultiplePromptCharacters() {